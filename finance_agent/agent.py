@@ -16,6 +16,7 @@ from google.adk.models.lite_llm import LiteLlm
 from google.adk.tools.agent_tool import AgentTool
 
 from .prompts import return_instructions_finance
+from .routing import RoutingLlm
 from .tools import YFinanceTools
 
 #import langchain tools
@@ -28,11 +29,34 @@ OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL")
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 
-# Initialize the model
-model = LiteLlm(
-    model="openrouter/openai/gpt-4.1-nano",
-    api_key=OPENROUTER_API_KEY,
-    api_base=OPENROUTER_BASE_URL
+# Comma-separated model lists for tool-selection hops and final-answer hops.
+# Listing more than one model enables latency routing and hedged requests.
+DEFAULT_MODELS = "openrouter/openai/gpt-4.1-nano"
+OPENROUTER_TOOL_MODELS = os.getenv("OPENROUTER_TOOL_MODELS", DEFAULT_MODELS)
+OPENROUTER_ANSWER_MODELS = os.getenv("OPENROUTER_ANSWER_MODELS", OPENROUTER_TOOL_MODELS)
+
+# One LiteLlm per model name, shared by both tiers so they share latency and health stats
+_endpoints = {}
+
+def build_endpoints(model_names: str) -> list[LiteLlm]:
+    """Get the LiteLlm endpoint for each comma-separated model name."""
+    endpoints = []
+    for name in (name.strip() for name in model_names.split(",")):
+        if not name:
+            continue
+        if name not in _endpoints:
+            _endpoints[name] = LiteLlm(
+                model=name,
+                api_key=OPENROUTER_API_KEY,
+                api_base=OPENROUTER_BASE_URL
+            )
+        endpoints.append(_endpoints[name])
+    return endpoints
+
+# Initialize the model, routing each request to the fastest healthy endpoint
+model = RoutingLlm(
+    tool_endpoints=build_endpoints(OPENROUTER_TOOL_MODELS),
+    answer_endpoints=build_endpoints(OPENROUTER_ANSWER_MODELS),
 )
 
 # Configure and initialize YFinanceTools with desired functionalities
@@ -0,0 +1,284 @@
+"""Latency-aware model routing for the finance agent.
+
+This module provides a model wrapper that spreads requests over several LLM
+backends (e.g. LiteLlm endpoints), keeps rolling latency and error statistics
+per backend, sends each request to the fastest healthy one and hedges slow
+requests with a second backend.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import AsyncGenerator
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from pydantic import Field, PrivateAttr
+
+_EMPTY = object()
+
+
+class EndpointStats:
+    """Rolling latency and error statistics for a single backend."""
+
+    def __init__(self, window: int):
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.last_failure = None
+
+    def record_latency(self, latency: float):
+        # Also used for hedged-away requests, which took at least this long
+        self.latencies.append(latency)
+
+    def record_success(self):
+        self.outcomes.append(True)
+
+    def record_failure(self):
+        self.outcomes.append(False)
+        self.last_failure = time.monotonic()
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def percentile(self, pct: float):
+        """Return the pct-th percentile (0-100) of recorded latencies, or None."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        rank = (len(ordered) - 1) * pct / 100
+        low = int(rank)
+        high = min(low + 1, len(ordered) - 1)
+        return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+    def is_healthy(self, max_error_rate: float, cooldown: float) -> bool:
+        if self.error_rate <= max_error_rate:
+            return True
+        # Give an unhealthy backend another chance once it has been quiet for a while
+        return time.monotonic() - self.last_failure >= cooldown
+
+
+def _is_answer_hop(llm_request: LlmRequest) -> bool:
+    """Return True when the request follows tool results, i.e. the model is expected to answer."""
+    if not llm_request.contents:
+        return False
+    parts = llm_request.contents[-1].parts or []
+    return any(part.function_response for part in parts)
+
+
+async def _stream_in_thread(
+    llm: BaseLlm, llm_request: LlmRequest, stream: bool
+) -> AsyncGenerator[LlmResponse, None]:
+    """
+    Run a backend's generator on its own thread and event loop.
+
+    LiteLlm's streaming path iterates a blocking client inside its async
+    generator, which would stall the caller's event loop (and with it any hedge
+    timer). Running it on a worker thread keeps the router responsive.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    cancelled = threading.Event()
+
+    def put(item):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            pass  # Caller's loop is gone, nobody is listening any more
+
+    async def drain():
+        agen = llm.generate_content_async(llm_request, stream=stream)
+        try:
+            async for response in agen:
+                if cancelled.is_set():
+                    break
+                put((response, None))
+        finally:
+            await agen.aclose()
+
+    def run():
+        try:
+            asyncio.run(drain())
+            put((_EMPTY, None))
+        except BaseException as e:
+            put((None, e))
+
+    threading.Thread(target=run, name=f"llm-{llm.model}", daemon=True).start()
+    try:
+        while True:
+            response, error = await queue.get()
+            if error is not None:
+                raise error
+            if response is _EMPTY:
+                return
+            yield response
+    finally:
+        cancelled.set()
+
+
+class _Attempt:
+    """One in-flight request to a backend, racing for the first response."""
+
+    def __init__(self, endpoint: BaseLlm, agen):
+        self.endpoint = endpoint
+        self.agen = agen
+        self.started = time.monotonic()
+        self.first = asyncio.ensure_future(self._first())
+
+    async def _first(self):
+        try:
+            return await self.agen.__anext__()
+        except StopAsyncIteration:
+            return _EMPTY
+
+    async def abandon(self):
+        self.first.cancel()
+        await asyncio.gather(self.first, return_exceptions=True)
+        await self.agen.aclose()
+
+
+class RoutingLlm(BaseLlm):
+    """
+    Route requests across several LLM backends by observed latency and health.
+
+    Each request goes to the healthy backend with the lowest median latency
+    (backends without measurements are tried first). If no response has arrived
+    once the chosen backend's `hedge_percentile` latency has passed, the same
+    request is sent to the next backend and whichever answers first wins; the
+    other request is abandoned. Backends that raise or return nothing are failed
+    over immediately.
+
+    Tool-selection hops use `tool_endpoints`; hops that follow tool results use
+    `answer_endpoints` (defaulting to `tool_endpoints`), so each can be served
+    by a different model tier.
+    """
+
+    model: str = "routing"
+    tool_endpoints: list[BaseLlm] = Field(min_length=1)
+    answer_endpoints: list[BaseLlm] = Field(default_factory=list)
+    hedge_percentile: float = 95.0
+    """Latency percentile of the primary backend after which a hedge is sent."""
+    hedge_default_delay: float = 4.0
+    """Hedge delay in seconds used until a backend has `min_samples` measurements."""
+    hedge_min_delay: float = 0.25
+    min_samples: int = 5
+    window: int = 50
+    """Number of recent requests kept per backend."""
+    max_error_rate: float = 0.5
+    failure_cooldown: float = 30.0
+    """Seconds after its last failure before an unhealthy backend is retried."""
+
+    _stats: dict = PrivateAttr(default_factory=dict)
+
+    def stats_for(self, endpoint: BaseLlm) -> EndpointStats:
+        key = id(endpoint)
+        if key not in self._stats:
+            self._stats[key] = EndpointStats(self.window)
+        return self._stats[key]
+
+    def rank(self, endpoints: list[BaseLlm]) -> list[BaseLlm]:
+        """Order backends fastest-healthy first, keeping configuration order for ties."""
+
+        def key(endpoint):
+            stats = self.stats_for(endpoint)
+            healthy = stats.is_healthy(self.max_error_rate, self.failure_cooldown)
+            return (not healthy, stats.percentile(50) or 0.0)
+
+        return sorted(endpoints, key=key)
+
+    def hedge_delay(self, endpoint: BaseLlm) -> float:
+        stats = self.stats_for(endpoint)
+        if len(stats.latencies) < self.min_samples:
+            return self.hedge_default_delay
+        return max(self.hedge_min_delay, stats.percentile(self.hedge_percentile))
+
+    def _start(self, endpoint: BaseLlm, llm_request: LlmRequest, stream: bool) -> _Attempt:
+        # Backends may append to contents, so each attempt gets its own list
+        request = llm_request.model_copy(update={"contents": list(llm_request.contents)})
+        if stream:
+            agen = _stream_in_thread(endpoint, request, stream)
+        else:
+            agen = endpoint.generate_content_async(request, stream=stream)
+        return _Attempt(endpoint, agen)
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        tier = self.tool_endpoints
+        if self.answer_endpoints and _is_answer_hop(llm_request):
+            tier = self.answer_endpoints
+        backups = self.rank(tier)
+        primary = backups.pop(0)
+
+        pending = {}
+        attempt = self._start(primary, llm_request, stream)
+        pending[attempt.first] = attempt
+        hedge_at = time.monotonic() + self.hedge_delay(primary)
+        hedged = False
+        winner, first_response, last_error = None, None, None
+
+        try:
+            while winner is None:
+                timeout = None
+                if backups and not hedged:
+                    timeout = max(0.0, hedge_at - time.monotonic())
+                done, _ = await asyncio.wait(
+                    pending.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Primary is slower than usual, race it against the next backend
+                    hedged = True
+                    attempt = self._start(backups.pop(0), llm_request, stream)
+                    pending[attempt.first] = attempt
+                    continue
+
+                for task in done:
+                    attempt = pending.pop(task)
+                    if task.exception() is not None:
+                        self.stats_for(attempt.endpoint).record_failure()
+                        last_error = task.exception()
+                        continue
+                    if task.result() is _EMPTY:
+                        # A backend that returns nothing would leave the turn without an answer
+                        self.stats_for(attempt.endpoint).record_failure()
+                        last_error = RuntimeError(f"{attempt.endpoint.model} returned no response")
+                        await attempt.agen.aclose()
+                        continue
+                    winner, first_response = attempt, task.result()
+                    break
+
+                if winner is None and not pending:
+                    if not backups:
+                        raise last_error
+                    # Fail over, giving the backup its own hedge deadline
+                    backup = backups.pop(0)
+                    attempt = self._start(backup, llm_request, stream)
+                    pending[attempt.first] = attempt
+                    hedge_at = time.monotonic() + self.hedge_delay(backup)
+                    hedged = False
+        finally:
+            for attempt in pending.values():
+                self.stats_for(attempt.endpoint).record_latency(time.monotonic() - attempt.started)
+                await attempt.abandon()
+
+        # Latency counts from the first response, the outcome only once the stream ends
+        stats = self.stats_for(winner.endpoint)
+        stats.record_latency(time.monotonic() - winner.started)
+        failed = False
+
+        try:
+            yield first_response
+            async for response in winner.agen:
+                yield response
+        except Exception:
+            failed = True
+            stats.record_failure()
+            raise
+        finally:
+            if not failed:
+                stats.record_success()
+            await winner.agen.aclose()
@@ -7,7 +7,75 @@ to fetch stock data, company information, and financial metrics using YFinance.
 """
 
 import json
+import threading
+import time
+from collections import OrderedDict
+
 import yfinance as yf
+from curl_cffi import requests as curl_requests
+
+# yfinance routes every Ticker through one process-wide session; give it a
+# single shared one rather than letting each pool swap in its own
+_SESSION = curl_requests.Session(impersonate="chrome")
+
+class TickerPool:
+    """
+    Bounded pool of yf.Ticker objects, one per symbol, on a shared session.
+
+    The pool hands out one Ticker per symbol and evicts the least recently used
+    symbol once max_size is reached. yf.Ticker caches what it downloads (news,
+    financials, recommendations, info), so repeat calls on a pooled Ticker skip
+    those downloads until it is rebuilt after max_age seconds. Callers that need
+    live data ask for a fresh Ticker instead. Price history is fetched on every
+    call either way.
+
+    Connection reuse and the Yahoo cookie/crumb are handled by yfinance itself,
+    which sends every Ticker's requests through one process-wide session; the
+    pool only makes sure all tickers use the same session object.
+    """
+
+    def __init__(self, max_size: int = 64, max_age: float = 60.0, session=None):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.session = session or _SESSION
+        self._tickers = OrderedDict()  # symbol -> (created, ticker)
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str, fresh: bool = False) -> yf.Ticker:
+        """
+        Get a Ticker for the symbol, reusing a pooled one while it is recent.
+
+        Args:
+            symbol (str): The stock symbol (e.g., 'AAPL', 'GOOGL', 'TSLA').
+            fresh (bool): Build a new Ticker so no cached data is returned. Defaults to False.
+
+        Returns:
+            yf.Ticker: A Ticker bound to the shared session.
+        """
+        symbol = symbol.upper()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._tickers.get(symbol)
+            if fresh or entry is None or now - entry[0] >= self.max_age:
+                entry = (now, yf.Ticker(symbol, session=self.session))
+                self._tickers[symbol] = entry
+            self._tickers.move_to_end(symbol)
+
+            while len(self._tickers) > self.max_size:
+                self._tickers.popitem(last=False)
+            return entry[1]
+
+    def discard(self, symbol: str):
+        """Remove the symbol's Ticker, e.g. after a failed request left it half-initialized."""
+        with self._lock:
+            self._tickers.pop(symbol.upper(), None)
+
+    def clear(self):
+        """Remove all pooled tickers."""
+        with self._lock:
+            self._tickers.clear()
+
+_DEFAULT_POOL = TickerPool()
 
 class YFinanceTools:
     def __init__(
@@ -21,7 +89,9 @@ class YFinanceTools:
         key_financial_ratios: bool = False,
         analyst_recommendations: bool = False,
         technical_indicators: bool = False,
+        ticker_pool: TickerPool = None,
     ):
+        self._ticker_pool = ticker_pool or _DEFAULT_POOL
         self._enabled_tools = []
         if stock_price:
             self._enabled_tools.append(self.get_current_stock_price)
@@ -56,7 +126,7 @@ class YFinanceTools:
             str: The current stock price or error message.
         """
         try:
-            stock = yf.Ticker(symbol.upper())
+            stock = self._ticker_pool.get(symbol, fresh=True)
             info = stock.info
             current_price = info.get("regularMarketPrice", info.get("currentPrice"))
             
@@ -66,6 +136,7 @@ class YFinanceTools:
             else:
                 return f"Could not fetch current price for {symbol.upper()}"
         except Exception as e:
+            self._ticker_pool.discard(symbol)
             return f"Error fetching current price for {symbol.upper()}: {str(e)}"
 
     def get_company_info(self, symbol: str) -> str:
@@ -79,7 +150,7 @@ class YFinanceTools:
             str: JSON string containing company profile and key metrics.
         """
         try:
-            stock = yf.Ticker(symbol.upper())
+            stock = self._ticker_pool.get(symbol, fresh=True)
             info = stock.info
             
             if not info:
@@ -113,6 +184,7 @@ class YFinanceTools:
             
             return json.dumps(company_data, indent=2)
         except Exception as e:
+            self._ticker_pool.discard(symbol)
             return f"Error fetching company info for {symbol.upper()}: {str(e)}"
 
     def get_historical_stock_prices(self, symbol: str, period: str = "1mo", interval: str = "1d") -> str:
@@ -128,7 +200,7 @@ class YFinanceTools:
             str: JSON string containing historical price data.
         """
         try:
-            stock = yf.Ticker(symbol.upper())
+            stock = self._ticker_pool.get(symbol)
             historical_data = stock.history(period=period, interval=interval)
             
             if historical_data.empty:
@@ -138,6 +210,7 @@ class YFinanceTools:
             historical_json = historical_data.to_json(orient="index", date_format="iso")
             return f"Historical data for {symbol.upper()} (Period: {period}, Interval: {interval}):\n{historical_json}"
         except Exception as e:
+            self._ticker_pool.discard(symbol)
             return f"Error fetching historical prices for {symbol.upper()}: {str(e)}"
 
     def get_stock_fundamentals(self, symbol: str) -> str:
@@ -151,7 +224,7 @@ class YFinanceTools:
             str: JSON string containing fundamental financial metrics.
         """
         try:
-            stock = yf.Ticker(symbol.upper())
+            stock = self._ticker_pool.get(symbol, fresh=True)
             info = stock.info
             
             if not info:
@@ -180,6 +253,7 @@ class YFinanceTools:
             
             return json.dumps(fundamentals, indent=2)
         except Exception as e:
+            self._ticker_pool.discard(symbol)
             return f"Error fetching fundamentals for {symbol.upper()}: {str(e)}"
 
     def get_company_news(self, symbol: str, num_stories: int = 5) -> str:
@@ -194,7 +268,7 @@ class YFinanceTools:
             str: JSON string containing recent company news.
         """
         try:
-            stock = yf.Ticker(symbol.upper())
+            stock = self._ticker_pool.get(symbol)
             news = stock.news
             
             if not news:
@@ -216,6 +290,7 @@ class YFinanceTools:
             
             return json.dumps(formatted_news, indent=2)
         except Exception as e:
+            self._ticker_pool.discard(symbol)
             return f"Error fetching news for {symbol.upper()}: {str(e)}"
 
     def get_income_statements(self, symbol: str) -> str:
@@ -228,10 +303,11 @@ class YFinanceTools:
             dict: JSON containing income statements or an empty dictionary.
         """
         try:
-            stock = yf.Ticker(symbol.upper())
+            stock = self._ticker_pool.get(symbol)
             financials = stock.financials
             return financials.to_json(orient="index")
         except Exception as e:
+            self._ticker_pool.discard(symbol)
             return f"Error fetching income statements for {symbol.upper()}: {str(e)}"
 
     def get_key_financial_ratios(self, symbol: str) -> str:
@@ -244,10 +320,11 @@ class YFinanceTools:
             dict: JSON containing key financial ratios.
         """
         try:
-            stock = yf.Ticker(symbol.upper())
+            stock = self._ticker_pool.get(symbol, fresh=True)
             key_ratios = stock.info
             return json.dumps(key_ratios, indent=2)
         except Exception as e:
+            self._ticker_pool.discard(symbol)
             return f"Error fetching key financial ratios for {symbol.upper()}: {str(e)}"
 
     def get_analyst_recommendations(self, symbol: str) -> str:
@@ -260,10 +337,11 @@ class YFinanceTools:
             str: JSON containing analyst recommendations.
         """
         try:
-            stock = yf.Ticker(symbol.upper())
+            stock = self._ticker_pool.get(symbol)
             recommendations = stock.recommendations
             return recommendations.to_json(orient="index")
         except Exception as e:
+            self._ticker_pool.discard(symbol)
             return f"Error fetching analyst recommendations for {symbol.upper()}: {str(e)}"
 
     def get_technical_indicators(self, symbol: str, period: str = "3mo") -> str:
@@ -278,7 +356,8 @@ class YFinanceTools:
             str: JSON containing technical indicators.
         """
         try:
-            indicators = yf.Ticker(symbol.upper()).history(period=period)
+            indicators = self._ticker_pool.get(symbol).history(period=period)
             return indicators.to_json(orient="index")
         except Exception as e:
+            self._ticker_pool.discard(symbol)
             return f"Error fetching technical indicators for {symbol.upper()}: {str(e)}" 
\ No newline at end of file
@@ -0,0 +1,362 @@
+"""Concurrent-user load test for the ADK `/run_sse` path.
+
+Each virtual user replays a conversation through the same flow as `app.py`:
+create a session, then send every prompt to `/run_sse` with streaming enabled
+and read the Server-Sent Events until the stream closes. Concurrency is ramped
+through a list of stages and each stage reports latency percentiles,
+throughput, error rate and server memory.
+
+Typical usage (stand-in LLM and offline data, no API keys needed):
+
+    python load_test/run.py --spawn-server --stages 1,5,10,25 --duration 30
+
+Or against an already running server:
+
+    adk api_server load_test
+    python load_test/run.py --server-pid <pid of adk>
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+
+# Minimum pause in seconds before retrying a failed session create
+SESSION_RETRY_BACKOFF = 0.5
+
+# Prompts modelled on the examples shown in app.py
+DEFAULT_CONVERSATIONS = [
+    [
+        "What is Apple's current stock price and recent performance?",
+        "What is Apple's P/E ratio and how does it compare to industry average?",
+    ],
+    [
+        "Compare the financial performance of Tesla vs Ford over the last year",
+        "What are the key financial ratios for Ford?",
+        "And Tesla's current price?",
+    ],
+    ["Analyze Microsoft's quarterly earnings and provide key insights"],
+    [
+        "What are the key financial ratios I should look at when evaluating Nvidia's stock?",
+        "What is Nvidia trading at right now?",
+    ],
+    ["What is Amazon's P/E ratio and how does it compare to industry average?"],
+    ["Create a detailed SWOT analysis for Netflix in the current streaming market"],
+]
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile (0-100) of values using linear interpolation."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def read_rss_mb(pid):
+    """Read the resident set size of a process (and its children) in MB from /proc."""
+    total_kb = 0
+    pids = [pid]
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            pids += [int(child) for child in f.read().split()]
+    except OSError:
+        pass
+    for p in pids:
+        try:
+            with open(f"/proc/{p}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total_kb / 1024 if total_kb else None
+
+
+def create_session(http, agent_url, agent_name, user_id):
+    """Create a new session exactly like app.py does, returning its id."""
+    session_id = f"session-{uuid.uuid4()}"
+    session_init_url = f"{agent_url}/apps/{agent_name}/users/{user_id}/sessions/{session_id}"
+    response = http.post(session_init_url, headers={"Content-Type": "application/json"}, json={"state": {}})
+    response.raise_for_status()
+    return session_id
+
+
+def run_turn(http, agent_url, agent_name, user_id, session_id, message, timeout):
+    """
+    Send one message to /run_sse and time the streamed response.
+
+    Returns a dict with time_to_first_event, time_to_final_text and total
+    (seconds, None when not observed) plus the number of events received.
+    """
+    payload = {
+        "appName": agent_name,
+        "userId": user_id,
+        "sessionId": session_id,
+        "newMessage": {"role": "user", "parts": [{"text": message}]},
+        "streaming": True,
+    }
+    headers = {"Content-Type": "application/json"}
+
+    start = time.perf_counter()
+    first_event = None
+    final_text = None
+    last_text = None
+    events = 0
+    buffer = b""
+
+    with http.post(f"{agent_url}/run_sse", headers=headers, json=payload, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=None):
+            if not chunk:
+                continue
+            # Keep incomplete lines around until the rest of the event arrives; only
+            # complete lines are decoded so multi-byte characters split across
+            # chunks stay intact
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in (raw.decode("utf-8") for raw in lines):
+                if not line.startswith("data:"):
+                    continue
+                json_data = line[len("data:"):].strip()
+                if not json_data:
+                    continue
+
+                event = json.loads(json_data)
+                now = time.perf_counter() - start
+                events += 1
+                if first_event is None:
+                    first_event = now
+                if "error" in event or event.get("errorCode"):
+                    raise RuntimeError(event.get("error") or event.get("errorMessage") or event.get("errorCode"))
+
+                parts = (event.get("content") or {}).get("parts") or []
+                if any("text" in part for part in parts):
+                    last_text = now
+                    if final_text is None and event.get("partial") is not True:
+                        final_text = now
+
+    return {
+        "time_to_first_event": first_event,
+        "time_to_final_text": final_text if final_text is not None else last_text,
+        "total": time.perf_counter() - start,
+        "events": events,
+    }
+
+
+class StageStats:
+    """Thread-safe collector for the results of one concurrency stage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.turns = []
+        self.session_errors = 0
+        self.turn_errors = 0
+        self.errors = {}
+        self.rss_samples = []
+
+    def add_turn(self, result):
+        with self._lock:
+            self.turns.append(result)
+
+    def add_error(self, kind, exc):
+        key = f"{type(exc).__name__}: {str(exc)[:120]}"
+        with self._lock:
+            if kind == "session":
+                self.session_errors += 1
+            else:
+                self.turn_errors += 1
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+
+def virtual_user(args, conversations, stats, stop_at):
+    """Replay random conversations on fresh sessions until the stage ends."""
+    http = requests.Session()
+    user_id = f"user-{uuid.uuid4()}"
+    rng = random.Random()
+    while time.monotonic() < stop_at:
+        try:
+            session_id = create_session(http, args.url, args.agent, user_id)
+        except Exception as e:
+            stats.add_error("session", e)
+            # Back off even without think time so a failing server isn't hammered
+            time.sleep(max(args.think_time, SESSION_RETRY_BACKOFF))
+            continue
+
+        for message in rng.choice(conversations):
+            if time.monotonic() >= stop_at:
+                break
+            try:
+                stats.add_turn(run_turn(http, args.url, args.agent, user_id, session_id, message, args.timeout))
+            except Exception as e:
+                stats.add_error("turn", e)
+                break
+            if args.think_time:
+                time.sleep(rng.uniform(0, 2 * args.think_time))
+    http.close()
+
+
+def sample_rss(pid, stats, stop_event, interval):
+    while not stop_event.is_set():
+        rss = read_rss_mb(pid)
+        if rss is not None:
+            stats.rss_samples.append(rss)
+        stop_event.wait(interval)
+
+
+def run_stage(args, conversations, users):
+    stats = StageStats()
+    stop_at = time.monotonic() + args.duration
+    stop_sampling = threading.Event()
+    sampler = None
+    if args.server_pid:
+        sampler = threading.Thread(
+            target=sample_rss, args=(args.server_pid, stats, stop_sampling, args.rss_interval), daemon=True
+        )
+        sampler.start()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        for _ in range(users):
+            pool.submit(virtual_user, args, conversations, stats, stop_at)
+    elapsed = time.perf_counter() - start
+
+    stop_sampling.set()
+    if sampler:
+        sampler.join()
+    return summarize(users, elapsed, stats)
+
+
+def summarize(users, elapsed, stats):
+    def pcts(values):
+        values = [v for v in values if v is not None]
+        return {f"p{p}": percentile(values, p) for p in (50, 95, 99)}
+
+    attempted = len(stats.turns) + stats.turn_errors
+    requests_made = attempted + stats.session_errors
+    failed = stats.turn_errors + stats.session_errors
+    return {
+        "users": users,
+        "elapsed_s": elapsed,
+        "turns": len(stats.turns),
+        "throughput_turns_per_s": len(stats.turns) / elapsed if elapsed else 0.0,
+        "error_rate": failed / requests_made if requests_made else 0.0,
+        "turn_error_rate": stats.turn_errors / attempted if attempted else 0.0,
+        "turn_errors": stats.turn_errors,
+        "session_errors": stats.session_errors,
+        "time_to_first_event_s": pcts(t["time_to_first_event"] for t in stats.turns),
+        "time_to_final_text_s": pcts(t["time_to_final_text"] for t in stats.turns),
+        "turn_total_s": pcts(t["total"] for t in stats.turns),
+        "server_rss_mb": pcts(stats.rss_samples),
+        "errors": stats.errors,
+    }
+
+
+def format_report(results):
+    def fmt(value, scale=1.0, digits=0):
+        return "-" if value is None else f"{value * scale:.{digits}f}"
+
+    header = (
+        f"{'users':>5} {'turns':>6} {'turn/s':>7} {'err%':>6} {'turn-err':>8} {'sess-err':>8} "
+        f"{'first-event ms p50/p95/p99':>28} {'final-text ms p50/p95/p99':>28} {'rss MB p50/p95/p99':>22}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        first = "/".join(fmt(r["time_to_first_event_s"][p], 1000) for p in ("p50", "p95", "p99"))
+        final = "/".join(fmt(r["time_to_final_text_s"][p], 1000) for p in ("p50", "p95", "p99"))
+        rss = "/".join(fmt(r["server_rss_mb"][p]) for p in ("p50", "p95", "p99"))
+        lines.append(
+            f"{r['users']:>5} {r['turns']:>6} {r['throughput_turns_per_s']:>7.2f} "
+            f"{r['error_rate'] * 100:>5.1f}% {r['turn_errors']:>8} {r['session_errors']:>8} {first:>28} {final:>28} {rss:>22}"
+        )
+    for r in results:
+        for error, count in r["errors"].items():
+            lines.append(f"[{r['users']} users] {count}x {error}")
+    return "\n".join(lines)
+
+
+def spawn_server(args):
+    """Start `adk api_server` on the stand-in agent and wait until it answers."""
+    adk = shutil.which("adk")
+    if not adk:
+        sys.exit("Could not find the `adk` executable; install google-adk or start the server yourself.")
+    agents_dir = os.path.dirname(os.path.abspath(__file__))
+    port = str(urlparse(args.url).port or 80)
+    process = subprocess.Popen(
+        [adk, "api_server", "--port", port, agents_dir],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            sys.exit(f"adk api_server exited with code {process.returncode}")
+        try:
+            requests.get(f"{args.url}/list-apps", timeout=1).raise_for_status()
+            return process
+        except requests.exceptions.RequestException:
+            time.sleep(0.5)
+    process.terminate()
+    sys.exit("Timed out waiting for adk api_server to start")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000", help="ADK agent API URL")
+    parser.add_argument("--agent", default="stub_agent", help="Agent name (use finance_agent for the real agent)")
+    parser.add_argument("--stages", default="1,5,10,25", help="Comma-separated concurrent user counts to ramp through")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run each stage")
+    parser.add_argument("--think-time", type=float, default=1.0, help="Mean pause in seconds between turns")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout in seconds")
+    parser.add_argument("--conversations", help="JSON file containing a list of conversations (lists of prompts)")
+    parser.add_argument("--server-pid", type=int, help="PID of the ADK server process to sample RSS from")
+    parser.add_argument("--rss-interval", type=float, default=0.5, help="Seconds between RSS samples")
+    parser.add_argument("--spawn-server", action="store_true", help="Start `adk api_server` with the stand-in agent")
+    parser.add_argument("--json", dest="json_path", help="Also write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    conversations = DEFAULT_CONVERSATIONS
+    if args.conversations:
+        with open(args.conversations) as f:
+            conversations = json.load(f)
+
+    server = spawn_server(args) if args.spawn_server else None
+    if server and not args.server_pid:
+        args.server_pid = server.pid
+
+    results = []
+    try:
+        for users in (int(s) for s in args.stages.split(",") if s.strip()):
+            print(f"Running {users} concurrent user(s) for {args.duration:.0f}s...", flush=True)
+            results.append(run_stage(args, conversations, users))
+    finally:
+        if server:
+            server.terminate()
+            server.wait(timeout=10)
+
+    print()
+    print(format_report(results))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Stand-in finance agent for load testing the ADK server.
+
+This agent mirrors the shape of `finance_agent` (one tool-selection hop followed
+by a streamed final answer) but replaces the OpenRouter model with a scripted
+LLM and the YFinance tools with offline data, so load tests measure the server
+and streaming path rather than third-party APIs.
+
+Simulated model latency can be tuned with environment variables:
+    STUB_LLM_TOOL_DELAY     seconds before the tool call is emitted (default 0.3)
+    STUB_LLM_CHUNK_DELAY    seconds between streamed text chunks (default 0.05)
+    STUB_LLM_CHUNKS         number of streamed text chunks (default 8)
+"""
+
+import asyncio
+import json
+import os
+import re
+from typing import AsyncGenerator
+
+from google.adk.agents import LlmAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+TOOL_DELAY = float(os.getenv("STUB_LLM_TOOL_DELAY", "0.3"))
+CHUNK_DELAY = float(os.getenv("STUB_LLM_CHUNK_DELAY", "0.05"))
+CHUNKS = int(os.getenv("STUB_LLM_CHUNKS", "8"))
+
+# Offline market data keyed by symbol
+OFFLINE_QUOTES = {
+    "AAPL": {"name": "Apple Inc.", "price": 212.44, "pe": 33.1, "market_cap": 3.17e12},
+    "MSFT": {"name": "Microsoft Corporation", "price": 478.87, "pe": 36.9, "market_cap": 3.56e12},
+    "TSLA": {"name": "Tesla, Inc.", "price": 322.05, "pe": 176.0, "market_cap": 1.04e12},
+    "F": {"name": "Ford Motor Company", "price": 10.85, "pe": 8.7, "market_cap": 4.3e10},
+    "NVDA": {"name": "NVIDIA Corporation", "price": 144.12, "pe": 46.4, "market_cap": 3.52e12},
+    "AMZN": {"name": "Amazon.com, Inc.", "price": 213.57, "pe": 34.8, "market_cap": 2.27e12},
+    "NFLX": {"name": "Netflix, Inc.", "price": 1225.35, "pe": 57.8, "market_cap": 5.2e11},
+}
+
+COMPANY_SYMBOLS = {
+    "apple": "AAPL",
+    "microsoft": "MSFT",
+    "tesla": "TSLA",
+    "ford": "F",
+    "nvidia": "NVDA",
+    "amazon": "AMZN",
+    "netflix": "NFLX",
+}
+
+
+def get_current_stock_price(symbol: str) -> str:
+    """
+    Get the current stock price for a given symbol from offline data.
+
+    Args:
+        symbol (str): The stock symbol (e.g., 'AAPL', 'GOOGL', 'TSLA').
+
+    Returns:
+        str: The current stock price or error message.
+    """
+    quote = OFFLINE_QUOTES.get(symbol.upper())
+    if not quote:
+        return f"Could not fetch current price for {symbol.upper()}"
+    return f"Current price of {symbol.upper()}: {quote['price']:.2f} USD"
+
+
+def get_stock_fundamentals(symbol: str) -> str:
+    """
+    Get fundamental financial data for a given stock symbol from offline data.
+
+    Args:
+        symbol (str): The stock symbol (e.g., 'AAPL', 'GOOGL', 'TSLA').
+
+    Returns:
+        str: JSON string containing fundamental financial metrics.
+    """
+    quote = OFFLINE_QUOTES.get(symbol.upper())
+    if not quote:
+        return f"Could not fetch fundamentals for {symbol.upper()}"
+    return json.dumps(
+        {
+            "symbol": symbol.upper(),
+            "company_name": quote["name"],
+            "pe_ratio": quote["pe"],
+            "market_cap": quote["market_cap"],
+        },
+        indent=2,
+    )
+
+
+def _find_symbol(text: str) -> str:
+    """Pick the first known company or ticker mentioned in the text."""
+    lowered = text.lower()
+    for company, symbol in COMPANY_SYMBOLS.items():
+        if company in lowered:
+            return symbol
+    for token in re.findall(r"\b[A-Z]{1,5}\b", text):
+        if token in OFFLINE_QUOTES:
+            return token
+    return "AAPL"
+
+
+class StubLlm(BaseLlm):
+    """Scripted LLM that calls one tool per turn, then streams a canned answer."""
+
+    model: str = "stub/finance-agent"
+
+    @classmethod
+    def supported_models(cls) -> list[str]:
+        return [r"stub/.*"]
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        last = llm_request.contents[-1] if llm_request.contents else None
+        parts = (last.parts or []) if last else []
+        tool_result = next(
+            (part.function_response for part in parts if part.function_response), None
+        )
+
+        if tool_result is None:
+            # Tool-selection hop: ask for fundamentals when the prompt hints at ratios
+            user_text = " ".join(part.text for part in parts if part.text)
+            tool_name = (
+                "get_stock_fundamentals"
+                if re.search(r"ratio|fundamental|p/e|valuation", user_text, re.I)
+                else "get_current_stock_price"
+            )
+            await asyncio.sleep(TOOL_DELAY)
+            yield LlmResponse(
+                content=types.Content(
+                    role="model",
+                    parts=[
+                        types.Part(
+                            function_call=types.FunctionCall(
+                                name=tool_name, args={"symbol": _find_symbol(user_text)}
+                            )
+                        )
+                    ],
+                )
+            )
+            return
+
+        # Final-answer hop: stream the answer in chunks, then send the full text
+        result = json.dumps(tool_result.response)
+        answer = (
+            f"Here is what I found using `{tool_result.name}`: {result}. "
+            "This summary was produced by the load-test stand-in model and is "
+            "not financial advice."
+        )
+        step = max(1, len(answer) // max(1, CHUNKS))
+        chunks = [answer[i:i + step] for i in range(0, len(answer), step)]
+        if stream:
+            for chunk in chunks:
+                await asyncio.sleep(CHUNK_DELAY)
+                yield LlmResponse(
+                    content=types.Content(role="model", parts=[types.Part(text=chunk)]),
+                    partial=True,
+                )
+        else:
+            await asyncio.sleep(CHUNK_DELAY * len(chunks))
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=answer)])
+        )
+
+
+# Create the stand-in finance agent
+root_agent = LlmAgent(
+    name="root_agent",
+    model=StubLlm(),
+    instruction="You are a finance assistant. Use the tools to answer stock questions.",
+    tools=[get_current_stock_price, get_stock_fundamentals],
+)
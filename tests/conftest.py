@@ -0,0 +1,5 @@
+import os
+
+# Importing finance_agent builds the agent, which needs API keys to be set
+os.environ.setdefault("OPENROUTER_API_KEY", "test")
+os.environ.setdefault("TAVILY_API_KEY", "test")
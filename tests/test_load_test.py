@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from load_test.run import StageStats, format_report, percentile, run_turn, summarize
+
+
+class FakeResponse:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        return iter(self.chunks)
+
+
+class FakeHttp:
+    """Stands in for requests.Session, replaying canned /run_sse chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.payloads = []
+
+    def post(self, url, headers=None, json=None, stream=False, timeout=None):
+        self.payloads.append(json)
+        return FakeResponse(self.chunks)
+
+
+def sse(event):
+    return f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8")
+
+
+def text_event(text, partial=None):
+    event = {"content": {"role": "model", "parts": [{"text": text}]}}
+    if partial is not None:
+        event["partial"] = partial
+    return event
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) is None
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([4, 1, 3, 2], 50) == 2.5
+    assert percentile(list(range(101)), 95) == 95
+
+
+def test_run_turn_parses_events_split_across_chunks():
+    call = {"content": {"role": "model", "parts": [{"functionCall": {"id": "1", "name": "t", "args": {}}}]}}
+    body = sse(call) + sse(text_event("Preis: 212 €", partial=True)) + sse(text_event("Preis: 212 € – fertig"))
+    # One byte per chunk cuts every JSON line and every multi-byte character
+    chunks = [body[i:i + 1] for i in range(len(body))]
+    http = FakeHttp(chunks)
+
+    result = run_turn(http, "http://agent", "stub_agent", "u", "s", "AAPL?", timeout=5)
+
+    assert result["events"] == 3
+    assert result["time_to_first_event"] <= result["time_to_final_text"] <= result["total"]
+    assert http.payloads[0]["streaming"] is True
+    assert http.payloads[0]["newMessage"]["parts"] == [{"text": "AAPL?"}]
+
+
+def test_run_turn_raises_on_error_event():
+    http = FakeHttp([sse({"error": "boom"})])
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_turn(http, "http://agent", "stub_agent", "u", "s", "AAPL?", timeout=5)
+
+
+def test_summarize_counts_session_and_turn_errors():
+    stats = StageStats()
+    for total in (0.1, 0.2, 0.3):
+        stats.add_turn({"time_to_first_event": total / 2, "time_to_final_text": total, "total": total, "events": 3})
+    stats.add_error("turn", RuntimeError("stream broke"))
+    stats.add_error("session", ConnectionError("refused"))
+    stats.rss_samples.extend([100.0, 110.0])
+
+    result = summarize(users=2, elapsed=2.0, stats=stats)
+
+    assert result["turns"] == 3
+    assert result["throughput_turns_per_s"] == 1.5
+    assert result["error_rate"] == 2 / 5
+    assert result["turn_error_rate"] == 1 / 4
+    assert result["session_errors"] == 1
+    assert result["time_to_final_text_s"]["p50"] == pytest.approx(0.2)
+    assert result["server_rss_mb"]["p50"] == 105.0
+    assert "sess-err" in format_report([result])
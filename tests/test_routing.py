@@ -0,0 +1,171 @@
+import asyncio
+import time
+
+import pytest
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from pydantic import ValidationError
+
+from finance_agent.routing import EndpointStats, RoutingLlm
+
+
+class MockLlm(BaseLlm):
+    """Local mock endpoint with configurable latency, failures and output."""
+
+    delay: float = 0.0
+    fail: bool = False
+    empty: bool = False
+    fail_mid_stream: bool = False
+    blocking: bool = False
+    calls: int = 0
+
+    async def generate_content_async(self, llm_request, stream=False):
+        self.calls += 1
+        if self.blocking:
+            time.sleep(self.delay)
+        else:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.model} is down")
+        if self.empty:
+            return
+        for i in range(3 if stream else 1):
+            yield LlmResponse(
+                content=types.Content(role="model", parts=[types.Part(text=f"{self.model}-{i}")]),
+                partial=stream,
+            )
+            if self.fail_mid_stream:
+                raise RuntimeError(f"{self.model} dropped the stream")
+
+
+def user_request():
+    return LlmRequest(contents=[types.Content(role="user", parts=[types.Part(text="AAPL price?")])])
+
+
+def tool_result_request():
+    response = types.FunctionResponse(name="get_current_stock_price", response={"result": "212.44"})
+    return LlmRequest(contents=[types.Content(role="user", parts=[types.Part(function_response=response)])])
+
+
+def generate(llm, llm_request, stream=False):
+    async def collect():
+        return [r.content.parts[0].text async for r in llm.generate_content_async(llm_request, stream=stream)]
+
+    return asyncio.run(collect())
+
+
+def test_slow_blocking_streaming_primary_is_hedged():
+    slow = MockLlm(model="slow", delay=5.0, blocking=True)
+    fast = MockLlm(model="fast")
+    llm = RoutingLlm(tool_endpoints=[slow, fast], hedge_default_delay=0.2)
+
+    start = time.monotonic()
+    texts = generate(llm, user_request(), stream=True)
+
+    assert texts == ["fast-0", "fast-1", "fast-2"]
+    assert time.monotonic() - start < 3.0
+    assert fast.calls == 1
+    assert llm.rank([slow, fast]) == [fast, slow]
+
+
+def test_failing_primary_fails_over():
+    bad = MockLlm(model="bad", fail=True)
+    good = MockLlm(model="good")
+    llm = RoutingLlm(tool_endpoints=[bad, good])
+
+    assert generate(llm, user_request()) == ["good-0"]
+    assert llm.stats_for(bad).error_rate == 1.0
+
+
+def test_failover_gets_its_own_hedge_deadline():
+    # The primary fails shortly before its own hedge deadline; the backup must not
+    # inherit that deadline and get hedged to the third endpoint
+    bad = MockLlm(model="bad", delay=0.8, fail=True)
+    backup = MockLlm(model="backup", delay=0.4)
+    third = MockLlm(model="third")
+    llm = RoutingLlm(tool_endpoints=[bad, backup, third], hedge_default_delay=1.0)
+
+    assert generate(llm, user_request()) == ["backup-0"]
+    assert third.calls == 0
+
+
+def test_mid_stream_failure_counts_once_and_demotes_endpoint():
+    flaky = MockLlm(model="flaky", fail_mid_stream=True)
+    good = MockLlm(model="good")
+    llm = RoutingLlm(tool_endpoints=[flaky, good])
+
+    with pytest.raises(RuntimeError, match="dropped the stream"):
+        generate(llm, user_request())
+
+    stats = llm.stats_for(flaky)
+    assert list(stats.outcomes) == [False]
+    assert not stats.is_healthy(llm.max_error_rate, llm.failure_cooldown)
+    assert llm.rank([flaky, good]) == [good, flaky]
+    assert generate(llm, user_request()) == ["good-0"]
+
+
+def test_empty_response_fails_over():
+    empty = MockLlm(model="empty", empty=True)
+    good = MockLlm(model="good")
+    llm = RoutingLlm(tool_endpoints=[empty, good])
+
+    assert generate(llm, user_request()) == ["good-0"]
+    assert llm.stats_for(empty).error_rate == 1.0
+
+
+def test_all_endpoints_failing_raises():
+    llm = RoutingLlm(tool_endpoints=[MockLlm(model="bad", fail=True)])
+
+    with pytest.raises(RuntimeError, match="bad is down"):
+        generate(llm, user_request())
+
+
+def test_answer_hop_uses_answer_endpoints():
+    tool = MockLlm(model="tool")
+    answer = MockLlm(model="answer")
+    llm = RoutingLlm(tool_endpoints=[tool], answer_endpoints=[answer])
+
+    assert generate(llm, user_request()) == ["tool-0"]
+    assert generate(llm, tool_result_request()) == ["answer-0"]
+
+
+def test_failed_endpoint_ranked_last_until_cooldown():
+    bad = MockLlm(model="bad", fail=True)
+    good = MockLlm(model="good")
+    llm = RoutingLlm(tool_endpoints=[bad, good], failure_cooldown=1.0)
+
+    generate(llm, user_request())
+    assert llm.rank([bad, good]) == [good, bad]
+
+    time.sleep(1.1)
+    assert llm.rank([bad, good]) == [bad, good]
+
+
+def test_empty_tool_endpoints_rejected():
+    with pytest.raises(ValidationError):
+        RoutingLlm(tool_endpoints=[])
+
+
+def test_endpoint_stats_percentile_interpolates():
+    stats = EndpointStats(window=3)
+    assert stats.percentile(50) is None
+
+    for latency in (0.4, 0.1, 0.3, 0.2):
+        stats.record_latency(latency)
+
+    # The window keeps the last three samples: 0.1, 0.3, 0.2
+    assert stats.percentile(50) == pytest.approx(0.2)
+    assert stats.percentile(100) == pytest.approx(0.3)
+    assert stats.percentile(25) == pytest.approx(0.15)
+
+
+def test_agent_tiers_share_endpoints_per_model():
+    from finance_agent.agent import build_endpoints
+
+    tool = build_endpoints("openrouter/a, openrouter/b")
+    answer = build_endpoints("openrouter/b,,openrouter/a")
+
+    assert [e.model for e in tool] == ["openrouter/a", "openrouter/b"]
+    assert answer[0] is tool[1] and answer[1] is tool[0]
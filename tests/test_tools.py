@@ -0,0 +1,56 @@
+import time
+
+from finance_agent.tools import TickerPool, YFinanceTools
+
+
+def test_pool_reuses_ticker_per_symbol_on_shared_session():
+    pool = TickerPool()
+    ticker = pool.get("aapl")
+
+    assert pool.get("AAPL") is ticker
+    assert ticker.ticker == "AAPL"
+    assert ticker.session is pool.session
+
+
+def test_pool_evicts_least_recently_used():
+    pool = TickerPool(max_size=2)
+    aapl = pool.get("AAPL")
+    pool.get("MSFT")
+    pool.get("AAPL")
+    pool.get("TSLA")
+
+    assert pool.get("AAPL") is aapl
+    assert list(pool._tickers) == ["TSLA", "AAPL"]
+
+
+def test_pool_rebuilds_expired_and_fresh_tickers():
+    pool = TickerPool(max_age=0.1)
+    ticker = pool.get("AAPL")
+
+    fresh = pool.get("AAPL", fresh=True)
+    assert fresh is not ticker
+    assert fresh.session is pool.session
+
+    time.sleep(0.15)
+    assert pool.get("AAPL") is not fresh
+
+
+def test_pool_discard():
+    pool = TickerPool()
+    ticker = pool.get("AAPL")
+    pool.discard("aapl")
+
+    assert pool.get("AAPL") is not ticker
+
+
+def test_pools_and_tools_share_defaults():
+    assert TickerPool().session is TickerPool().session
+    assert YFinanceTools()._ticker_pool is YFinanceTools()._ticker_pool
+
+
+def test_tools_share_the_given_pool():
+    pool = TickerPool()
+    tools = YFinanceTools(stock_price=True, company_news=True, ticker_pool=pool)
+
+    assert len(list(tools)) == 2
+    assert tools._ticker_pool is pool